@@ -1,7 +1,7 @@
 from __future__ import annotations
+import logging
 import random
 from typing import Callable, Optional, Tuple
-from collections import deque
 from enum import Enum
 import math
 from pathlib import Path
@@ -10,6 +10,8 @@ import pygame
 from pygame import Color
 from pygame.event import Event
 
+logger = logging.getLogger(__name__)
+
 
 class Theme:
     """Colors used by the game, labeled according to their purpose
@@ -38,10 +40,84 @@ class Edge(Enum):
     RIGHT = (1, 0)
 
 
+def _resolve_pixels(
+    x: float,
+    y: float,
+    corner_x: int,
+    corner_y: int,
+    outer_width: float,
+    outer_height: float,
+) -> Tuple[float, float]:
+    """Computes the absolute coordinates of a point offset from a window corner
+
+    - Pure arithmetic on plain floats, kept at module level so the per-frame \
+    position pipeline doesn't pay for method dispatch or enum lookups
+    """
+    # Coordinates of the window corner that we're working relative to
+    base_x_coordinate = corner_x * outer_width
+    base_y_coordinate = corner_y * outer_height
+
+    # Calculate the number of pixels away from the corner that we should be at
+    x_offset = -x if corner_x else +x
+    y_offset = -y if corner_y else +y
+
+    return (base_x_coordinate + x_offset, base_y_coordinate + y_offset)
+
+
+def _build_corner_multipliers() -> dict[
+    Tuple[Optional[Corner], Corner], Tuple[float, float]
+]:
+    """Precomputes the size multipliers for every (from, to) corner pairing
+
+    - There are only 5 x 4 combinations (the None "from" meaning the object's \
+    centre), so tabulating them turns corner offset calculation into a dict \
+    lookup and two multiplies, with no branching
+    """
+    multipliers: dict[Tuple[Optional[Corner], Corner], Tuple[float, float]] = {}
+    for corner_to in Corner:
+        to_x, to_y = corner_to.value
+        # From the centre: half the object's size, towards the target corner
+        multipliers[(None, corner_to)] = (
+            0.5 if to_x == 1 else -0.5,
+            0.5 if to_y == 1 else -0.5,
+        )
+        for corner_from in Corner:
+            from_x, from_y = corner_from.value
+            multipliers[(corner_from, corner_to)] = (to_x - from_x, to_y - from_y)
+    return multipliers
+
+
+_CORNER_MULTIPLIERS = _build_corner_multipliers()
+
+
 class PointSpecifier:
+    # Subclasses declare storage via their own __slots__
+    __slots__ = ()
+
     outer_corner: Corner
     self_corner: Optional[Corner]
 
+    # The coordinates live behind properties so that any write — including
+    # direct assignments like `position.x = 0`, not just move_* calls —
+    # invalidates the memoized top-left below
+    @property
+    def x(self) -> float:
+        return self._x
+
+    @x.setter
+    def x(self, value: float):
+        self._x = value
+        self._cache_version += 1
+
+    @property
+    def y(self) -> float:
+        return self._y
+
+    @y.setter
+    def y(self, value: float):
+        self._y = value
+        self._cache_version += 1
+
     def resolve(
         self, game: Game
     ) -> Tuple[float, float]:
@@ -66,30 +142,25 @@ class PointSpecifier:
     def calculate_offest_to_corner(
         self, object_width: float, object_height: float, corner_to: Corner
     ) -> Tuple[float, float]:
-        corner_from = self.self_corner
-
-        if corner_from == corner_to:
-            return (0, 0)
+        multiplier_x, multiplier_y = _CORNER_MULTIPLIERS[(self.self_corner, corner_to)]
+        return (object_width * multiplier_x, object_height * multiplier_y)
 
-        corner_to_x, corner_to_y = corner_to.value
-        if corner_from is None:
-            # Calculating from center
-            x_multiplier = 1 if corner_to_x == 1 else -1
-            y_multiplier = 1 if corner_to_y == 1 else -1
-            offset_x = (object_width / 2) * x_multiplier
-            offset_y = (object_height / 2) * y_multiplier
-            return (offset_x, offset_y)
-
-        corner_from_x, corner_from_y = corner_from.value
-        x_multiplier = corner_to_x - corner_from_x
-        y_multiplier = corner_to_y - corner_from_y
-        offset_x = object_width * x_multiplier
-        offset_y = object_height * y_multiplier
+    def calculate_top_left(self, game: Game, object_width: float, object_height: float):
+        """Calculates the top-left coordinate, memoized for the duration of the tick
 
-        return (offset_x, offset_y)
+        - Both collision_box() and draw() need this every frame, so caching \
+        the result avoids running the resolve chain twice (or more) per object
+        - The cache key includes a version counter that the x/y setters bump, \
+        so any coordinate change within a tick invalidates the cached value
+        """
+        cache_key = (game._tick_id, self._cache_version, object_width, object_height)
+        cached = self._top_left_cache
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
 
-    def calculate_top_left(self, game: Game, object_width: float, object_height: float):
-        return self.find_corner(Corner.TOP_LEFT, game, object_width, object_height)
+        top_left = self.find_corner(Corner.TOP_LEFT, game, object_width, object_height)
+        self._top_left_cache = (cache_key, top_left)
+        return top_left
 
     def find_corner(
         self, corner: Corner, game: Game, object_width: float, object_height: float
@@ -104,6 +175,17 @@ class PointSpecifier:
 
 
 class PixelsPoint(PointSpecifier):
+    __slots__ = (
+        "_x",
+        "_y",
+        "outer_corner",
+        "self_corner",
+        "_corner_x",
+        "_corner_y",
+        "_cache_version",
+        "_top_left_cache",
+    )
+
     def __init__(
         self,
         x: float,
@@ -119,56 +201,58 @@ class PixelsPoint(PointSpecifier):
         @self_corner: If this point represents an object's position, the corner of said object that this coordinate represents. \
         Defaults to `None`, which means this point represents the object's centre (or isn't attached to any object).
         """
+        # The cache fields must exist before the x/y setters run
+        self._cache_version = 0
+        self._top_left_cache = None
         self.x = x
         self.y = y
         self.outer_corner = outer_corner
         self.self_corner = self_corner
+        # Cache the corner components as plain ints, since looking up
+        # Enum.value and unpacking the tuple is surprisingly costly on the
+        # per-frame resolve/move paths
+        self._corner_x, self._corner_y = outer_corner.value
 
     def resolve(self, game: Game) -> Tuple[float, float]:
-        outer_width = game.window_box().width
-        outer_height = game.window_box().height
-        multiplier_x, multiplier_y = self.outer_corner.value
-
-        # Coordinates of the window corner that we're working relative to
-        base_x_coordinate = multiplier_x * outer_width
-        base_y_coordinate = multiplier_y * outer_height
-
-        # Calculate the number of pixels away from the corner that we should be at
-        x_offset = -self.x if multiplier_x else +self.x
-        y_offset = -self.y if multiplier_y else +self.y
-
-        # Calculate the desired coordinates of the top-left of our object
-        actual_x_coordinate = base_x_coordinate + x_offset
-        actual_y_coordinate = base_y_coordinate + y_offset
+        outer_box = game.window_box()
 
-        # print(actual_x_coordinate, actual_y_coordinate)
-        return (actual_x_coordinate, actual_y_coordinate)
+        return _resolve_pixels(
+            self.x,
+            self.y,
+            self._corner_x,
+            self._corner_y,
+            outer_box.width,
+            outer_box.height,
+        )
 
     def move_right(self, pixels: float):
-        x_corner = self.outer_corner.value[0]
-        pixel_movement = -pixels if x_corner else +pixels
-        self.x += pixel_movement
+        # (1 - 2 * corner) encodes the sign flip: +1 when measuring from the
+        # left edge, -1 when measuring from the right edge
+        # (cache invalidation happens in the coordinate setters)
+        self.x += pixels * (1 - 2 * self._corner_x)
 
     def move_left(self, pixels: float):
-        x_corner = self.outer_corner.value[0]
-        pixel_movement = +pixels if x_corner else -pixels
-        self.x += pixel_movement
+        self.x -= pixels * (1 - 2 * self._corner_x)
 
     def move_down(self, pixels: float):
-        y_corner = self.outer_corner.value[1]
-        pixel_movement = -pixels if y_corner else +pixels
-        self.y += pixel_movement
+        self.y += pixels * (1 - 2 * self._corner_y)
 
     def move_up(self, pixels: float):
-        y_corner = self.outer_corner.value[1]
-        pixel_movement = +pixels if y_corner else -pixels
-        self.y += pixel_movement
-
-    def on_window_resize(self, event):
-        pass
+        self.y -= pixels * (1 - 2 * self._corner_y)
 
 
 class PercentagePoint(PointSpecifier):
+    __slots__ = (
+        "_x",
+        "_y",
+        "outer_corner",
+        "self_corner",
+        "_corner_x",
+        "_corner_y",
+        "_cache_version",
+        "_top_left_cache",
+    )
+
     def __init__(
         self,
         x: float,
@@ -176,11 +260,14 @@ class PercentagePoint(PointSpecifier):
         outer_corner: Corner = Corner.TOP_LEFT,
         self_corner: Optional[Corner] = None,
     ):
+        # The cache fields must exist before the x/y setters run
+        self._cache_version = 0
+        self._top_left_cache = None
         self.x = x
         self.y = y
         self.outer_corner = outer_corner
         self.self_corner = self_corner
-        self.object = object
+        self._corner_x, self._corner_y = outer_corner.value
 
     def resolve(
         self, game: Game, width: float = 0, height: float = 0
@@ -189,26 +276,34 @@ class PercentagePoint(PointSpecifier):
         x_pixels = self.x * outer_box.width
         y_pixels = self.y * outer_box.height
 
-        pixels_point = PixelsPoint(
-            x_pixels, y_pixels, self.outer_corner, self.self_corner
+        return _resolve_pixels(
+            x_pixels,
+            y_pixels,
+            self._corner_x,
+            self._corner_y,
+            outer_box.width,
+            outer_box.height,
         )
-        return pixels_point.resolve(game)
-
-    def on_window_resize(self, event):
-        # We don't need to do anything on window resize
-        # since the percentage positions will still be valid
-        pass
 
 
 class Box:
+    # Boxes are allocated constantly (one per collision_box() call), so a
+    # fixed slot layout avoids the per-instance __dict__ entirely
+    __slots__ = ("x1", "y1", "x2", "y2")
+
     def __init__(self, x1: float, y1: float, x2: float, y2: float):
         self.x1 = x1
         self.y1 = y1
         self.x2 = x2
         self.y2 = y2
 
-        self.width = x2 - x1
-        self.height = y2 - y1
+    @property
+    def width(self) -> float:
+        return self.x2 - self.x1
+
+    @property
+    def height(self) -> float:
+        return self.y2 - self.y1
 
     @property
     def top(self) -> float:
@@ -234,34 +329,40 @@ class Box:
         return (center_x, center_y)
 
     def is_inside(self, outer_box: Box, allowed_margin=0.0) -> bool:
-        is_within_x = (
-            outer_box.left - self.left <= allowed_margin
-            and self.right - outer_box.right <= allowed_margin
+        # Combining all four comparisons with & (rather than `and`) skips the
+        # short-circuit branches, which is slightly cheaper per call
+        return bool(
+            (outer_box.left - self.left <= allowed_margin)
+            & (self.right - outer_box.right <= allowed_margin)
+            & (outer_box.top - self.top <= allowed_margin)
+            & (self.bottom - outer_box.bottom <= allowed_margin)
         )
 
-        is_within_y = (
-            outer_box.top - self.top <= allowed_margin
-            and self.bottom - outer_box.bottom <= allowed_margin
-        )
-
-        return is_within_x and is_within_y
-
     def intersects_with_point(self, coordinates: Tuple[float, float]):
         other_x, other_y = coordinates
-        is_within_x = self.x1 <= other_x <= self.x2
-        is_within_y = self.y1 <= other_y <= self.y2
-        return is_within_x and is_within_y
+        return bool(
+            (self.x1 <= other_x)
+            & (other_x <= self.x2)
+            & (self.y1 <= other_y)
+            & (other_y <= self.y2)
+        )
 
     def is_outside(self, other_box: Box) -> bool:
-        is_outside_x = self.right < other_box.left or self.left > other_box.right
-
-        is_outside_y = self.bottom < other_box.top or self.top > other_box.bottom
-
-        return is_outside_x or is_outside_y
+        return bool(
+            (self.right < other_box.left)
+            | (self.left > other_box.right)
+            | (self.bottom < other_box.top)
+            | (self.top > other_box.bottom)
+        )
 
 
 class Game:
     def __init__(self, max_fps):
+        # Initialise all of pygame's subsystems up front, rather than lazily
+        # mid-session (e.g. on the first font render or key event), so the
+        # setup cost is paid once before the game loop starts
+        pygame.init()
+
         # Window display config
         self.theme = Theme
         self.background_color = self.theme.BACKGROUND
@@ -270,74 +371,172 @@ class Game:
         self.surface = pygame.display.set_mode((600, 400), pygame.RESIZABLE)
         pygame.display.set_caption("Mole Abuse")
 
+        # Block event types that on_event never handles, so they're discarded
+        # at the SDL layer instead of being built into Python Event objects
+        # just for the elif-chain to ignore (mouse motion alone can fire
+        # hundreds of times per second)
+        pygame.event.set_blocked(
+            [
+                pygame.MOUSEMOTION,
+                pygame.ACTIVEEVENT,
+                pygame.TEXTINPUT,
+                pygame.TEXTEDITING,
+                pygame.AUDIODEVICEADDED,
+                pygame.WINDOWENTER,
+                pygame.WINDOWLEAVE,
+            ]
+        )
+
+        # Cache the window dimensions (and the matching Box) so that resolving
+        # positions doesn't have to ask the display surface every call.
+        # These only change on a VIDEORESIZE event, which rebuilds them.
+        self._window_dims = (self.surface.get_width(), self.surface.get_height())
+        self._window_box = Box(0, 0, *self._window_dims)
+
+        # Map the background color to the display's pixel format once, so the
+        # per-frame fill skips the color conversion
+        self._background_fill = self.surface.map_rgb(self.background_color)
+
+        # Dirty-rect bookkeeping: only the patches of the screen that changed
+        # get cleared and pushed to the display each frame
+        self._previous_frame_rects: list[pygame.Rect] = []
+        self._dirty_rects: Optional[list[pygame.Rect]] = None
+        self._needs_full_redraw = True
+
         # Initialise other game components
         self.max_fps = max_fps
         self.clock = pygame.time.Clock()
         self.exited = False
         self.objects: list[GameObject] = []
+        # Flat lists of bound draw methods and tick callbacks, rebuilt when
+        # the object list changes so the per-frame loops don't have to
+        # re-resolve attributes or iterate nested lists
+        self._draw_callbacks: list[Callable] = []
+        self._tick_callbacks: list[Callable] = []
         self.old_window_dimensions = (self.width(), self.height())
         self.key_action_callbacks = {}
-        self.key_up_callbacks = {}
+        # KEYDOWN/KEYUP dispatch indexes these flat tables by keycode, which
+        # skips the dict hash on the input hot path. Printable pygame keycodes
+        # are small ints; extended keycodes (arrow keys and other
+        # non-printable keys have bit 30 set) spill into the companion dicts.
+        self.key_up_callbacks: list[Optional[Callable]] = [None] * 512
+        self.extended_key_up_callbacks: dict[int, Callable] = {}
         self.is_paused = False
-        self.recent_frame_times = deque(maxlen=10)
+        # Fixed-size ring buffer of the last 10 frame times, plus a running
+        # sum, so recording a frame is two index operations and the average
+        # is a single division
+        self._frame_time_ring = [0] * 10
+        self._frame_time_cursor = 0
+        self._frame_time_count = 0
+        self._frame_time_sum = 0
+        # Counts completed ticks; used to scope per-tick position caches
+        self._tick_id = 0
+        # Snapshot of pygame.time.get_ticks(), refreshed once per tick so
+        # every age() check in the same tick shares one clock read
+        self.current_tick_ms = pygame.time.get_ticks()
+        # Flat list of (x1, y1, x2, y2) collision boxes, kept in the same order
+        # as self.objects and rebuilt once per tick (see _refresh_object_boxes)
+        self._object_boxes: list[Tuple[float, float, float, float]] = []
 
         # Set up default keybinds
-        self.keybinds = {}
-
-        pygame.init()
+        self.keybinds: list[Optional[str]] = [None] * 512
+        self.extended_keybinds: dict[int, str] = {}
+
+        # Dispatch table for the event loop: one dict lookup per event
+        # instead of walking an elif-chain of type comparisons
+        self._event_handlers: dict[int, Callable[[Event], None]] = {
+            pygame.QUIT: self._on_quit,
+            pygame.VIDEORESIZE: self._on_resize,
+            pygame.KEYDOWN: self._on_key_down,
+            pygame.KEYUP: self._on_key_up,
+            pygame.MOUSEBUTTONUP: self._on_mouse_up,
+        }
 
     def width(self) -> int:
         """Returns the width of the window, in pixels"""
-        return self.surface.get_width()
+        return self._window_dims[0]
 
     def height(self) -> int:
         """Returns the height of the window, in pixels"""
-        return self.surface.get_height()
+        return self._window_dims[1]
 
     def window_box(self) -> Box:
-        """Calculates the box that represents the size of the window"""
-        x1 = 0
-        y1 = 0
-        x2 = self.width()
-        y2 = self.height()
-
-        return Box(x1, y1, x2, y2)
+        """Returns the box that represents the size of the window"""
+        return self._window_box
 
     def on_event(self, event):
-        # print(event)
-        if event.type == pygame.QUIT:
-            self.exited = True
-        elif event.type == pygame.VIDEORESIZE:
-            event.old_dimensions = self.old_window_dimensions
-            for object in self.objects:
+        """Dispatches an event to the handler for its type, if there is one"""
+        handler = self._event_handlers.get(event.type)
+        if handler is not None:
+            handler(event)
+
+    def _on_quit(self, event: Event):
+        self.exited = True
+
+    def _on_resize(self, event: Event):
+        event.old_dimensions = self.old_window_dimensions
+        # Rebuild the cached window dimensions before objects react to them
+        self._window_dims = event.size
+        self._window_box = Box(0, 0, *event.size)
+        # Invalidate any positions cached earlier this tick, since they
+        # were computed against the old window dimensions
+        self._tick_id += 1
+        # Only dispatch to positions that actually override the base no-op
+        # handler, so a rapid drag-resize doesn't pay a Python call per
+        # object just to do nothing
+        base_handler = PointSpecifier.on_window_resize
+        for object in self.objects:
+            if type(object.position).on_window_resize is not base_handler:
                 object.position.on_window_resize(event)
-            self.old_window_dimensions = (self.width(), self.height())
-
-        # Keyboard input
-        elif event.type == pygame.KEYDOWN:
-            if event.key in self.keybinds:
-                action = self.keybinds[event.key]
-                self.trigger_key_action(action, event)
-        elif event.type == pygame.KEYUP:
-            if event.key in self.key_up_callbacks:
-                callback = self.key_up_callbacks[event.key]
-                callback()
+        self.old_window_dimensions = self._window_dims
+        # The resize wipes the window contents, so repaint everything
+        self._needs_full_redraw = True
+
+    def _on_key_down(self, event: Event):
+        key = event.key
+        action = (
+            self.keybinds[key]
+            if key < len(self.keybinds)
+            else self.extended_keybinds.get(key)
+        )
+        if action is not None:
+            self.trigger_key_action(action, event)
+
+    def _on_key_up(self, event: Event):
+        key = event.key
+        callback = (
+            self.key_up_callbacks[key]
+            if key < len(self.key_up_callbacks)
+            else self.extended_key_up_callbacks.get(key)
+        )
+        if callback is not None:
+            callback()
 
-        # Mouse clicks
-        elif event.type == pygame.MOUSEBUTTONUP:
-            click_x, click_y = event.pos
-            for object in self.objects:
-                if object.collision_box().intersects_with_point(event.pos):
-                    # Run any on-click callbacks for the object
-                    for callback in object.on_click_tasks:
-                        callback(event)
+    def _on_mouse_up(self, event: Event):
+        click_x, click_y = event.pos
+        for object, (x1, y1, x2, y2) in zip(self.objects, self._object_boxes):
+            if x1 <= click_x <= x2 and y1 <= click_y <= y2:
+                # Run any on-click callbacks for the object
+                for callback in object.on_click_tasks:
+                    callback(event)
 
     def trigger_key_action(self, action: str, event: pygame.event.Event):
         if action not in self.key_action_callbacks:
             return
         action_callback = self.key_action_callbacks[action]
         on_key_up = action_callback(event)
-        self.key_up_callbacks[event.key] = lambda: on_key_up(event)
+        key = event.key
+        if key < len(self.key_up_callbacks):
+            self.key_up_callbacks[key] = lambda: on_key_up(event)
+        else:
+            self.extended_key_up_callbacks[key] = lambda: on_key_up(event)
+
+    def bind_key(self, key: int, action: str):
+        """Binds a pygame keycode to a named action"""
+        if key < len(self.keybinds):
+            self.keybinds[key] = action
+        else:
+            self.extended_keybinds[key] = action
 
     def on_key_action(self, action: str):
         def decorator(callback):
@@ -345,17 +544,87 @@ class Game:
 
         return decorator
 
+    def record_frame_time(self, frame_time: int):
+        """Records how long the last frame took, keeping the running total updated
+
+        - The new value overwrites the oldest slot in the ring buffer, with \
+        the running sum adjusted by the difference
+        """
+        ring = self._frame_time_ring
+        cursor = self._frame_time_cursor
+        self._frame_time_sum += frame_time - ring[cursor]
+        ring[cursor] = frame_time
+        self._frame_time_cursor = (cursor + 1) % len(ring)
+        if self._frame_time_count < len(ring):
+            self._frame_time_count += 1
+
     def milliseconds_per_frame(self):
         """Returns average time taken to compute, render, and draw the last 10 frames"""
-        times = self.recent_frame_times
-        if not len(times):
+        if not self._frame_time_count:
             # Default to 0 if we haven't recorded any frame times yet
             return 0
-        sum = 0
-        for time in times:
-            sum += time
-        average = sum / len(times)
-        return average
+        return self._frame_time_sum / self._frame_time_count
+
+    def add_object(self, object: GameObject) -> int:
+        """Registers a game object, caching its draw and tick callbacks
+
+        - Returns the object's index in the objects list, which callers can \
+        track to remove the object later without a linear scan
+        """
+        self.objects.append(object)
+        self._draw_callbacks.append(object.draw)
+        self._tick_callbacks.extend(object.tick_tasks)
+        return len(self.objects) - 1
+
+    def remove_object(self, object: GameObject):
+        """Unregisters a game object and rebuilds the cached callback lists"""
+        self.objects.remove(object)
+        self._rebuild_object_callbacks()
+
+    def _rebuild_object_callbacks(self):
+        self._draw_callbacks = [object.draw for object in self.objects]
+        self._tick_callbacks = [
+            task for object in self.objects for task in object.tick_tasks
+        ]
+
+    def _refresh_object_boxes(self):
+        """Rebuilds the flat list of object collision boxes
+
+        - Keeping the coordinates as plain tuples, parallel to self.objects, \
+        lets per-event hit testing compare floats directly instead of \
+        allocating a Box and dispatching methods for every object
+        """
+        self._object_boxes = [
+            (box.x1, box.y1, box.x2, box.y2)
+            for box in (object.collision_box() for object in self.objects)
+        ]
+
+    def broad_phase(self) -> list[Tuple[int, int]]:
+        """Finds pairs of objects whose collision boxes overlap
+
+        - Sweep-and-prune over the per-tick box list: objects are visited in \
+        order of their left edge, and only pairs that overlap on the X axis \
+        get their Y extents compared
+        - Returns (i, j) index pairs into self.objects, ready for a \
+        narrow-phase check to filter further
+        """
+        boxes = self._object_boxes
+        order = sorted(range(len(boxes)), key=lambda index: boxes[index][0])
+
+        candidate_pairs: list[Tuple[int, int]] = []
+        active: list[int] = []
+        for index in order:
+            x1, y1, _, y2 = boxes[index]
+            # Drop boxes from the active list once the sweep has passed them
+            active = [other for other in active if boxes[other][2] >= x1]
+            for other in active:
+                other_y1 = boxes[other][1]
+                other_y2 = boxes[other][3]
+                if other_y1 <= y2 and y1 <= other_y2:
+                    candidate_pairs.append((other, index))
+            active.append(index)
+
+        return candidate_pairs
 
     def execute_tick(self):
         """Updates the states and positions of all game objects.
@@ -365,20 +634,34 @@ class Game:
         - Runs the tick tasks for each game object
         - This is essentially the computational/"logical server" side of the game
         """
+        self.current_tick_ms = pygame.time.get_ticks()
+        self._tick_id += 1
+        self._refresh_object_boxes()
+        # Dispatch straight from the handler table, rather than bouncing
+        # every event through on_event()
+        handler_for = self._event_handlers.get
         for event in pygame.event.get():
-            self.on_event(event)
+            handler = handler_for(event.type)
+            if handler is not None:
+                handler(event)
 
         # Handle dead moles
         if not self.current_mole.alive:
-            self.objects.remove(self.current_mole)
-            print("New mole!")
+            # The mole's index is tracked, so removal is a swap-pop rather
+            # than list.remove's linear scan and element shift
+            objects = self.objects
+            last = objects.pop()
+            if self._mole_index < len(objects):
+                objects[self._mole_index] = last
+            self._rebuild_object_callbacks()
+            logger.debug("New mole!")
             self.current_mole = Mole(game=self)
-            self.objects.append(self.current_mole)
-        
+            self._mole_index = self.add_object(self.current_mole)
+
         # Update the objects
         if not self.is_paused:
-            for object in self.objects:
-                object.run_tick_tasks()
+            for callback in self._tick_callbacks:
+                callback()
         else:
             # Always update the FPS counter
             self.fps_counter.run_tick_tasks()
@@ -389,41 +672,71 @@ class Game:
         - This should happen every frame
         - Should be called after objects have ticked but before the display is updated
         - This is the graphical/"logical client" side of the game
+        - Only the regions that changed since the last frame are cleared and \
+        marked dirty — most of the window is static background, so pushing \
+        just the objects' old and new rects saves a full-window blit
         """
-        # Clear the entire surface
-        self.surface.fill(self.background_color)
-
-        # Draw each object
-        for object in self.objects:
-            object.draw()
+        if self._needs_full_redraw:
+            # Clear the entire surface (first frame, or after a resize)
+            self.surface.fill(self._background_fill)
+            self._dirty_rects = None
+        else:
+            # Erase each object's previous position; everything gets redrawn
+            # on top below
+            for rect in self._previous_frame_rects:
+                self.surface.fill(self._background_fill, rect)
+
+        # Draw each object, collecting the rects that were actually blitted
+        # (recomputing them from the collision box isn't safe: a texture can
+        # change size during its draw, e.g. a right-anchored text getting
+        # narrower, and the box would then disagree with where pixels landed)
+        current_rects = []
+        for draw in self._draw_callbacks:
+            rect = draw()
+            if rect is not None:
+                current_rects.append(rect)
+
+        if not self._needs_full_redraw:
+            # Both where the objects were and where they are now have changed
+            self._dirty_rects = self._previous_frame_rects + current_rects
+        self._previous_frame_rects = current_rects
+        self._needs_full_redraw = False
 
     def update_display(self):
-        pygame.display.update()
+        if self._dirty_rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(self._dirty_rects)
 
     def game_session(self):
         self.score = 0
-        
+
         self.fps_counter = FPSCounter(game=self)
-        self.objects.append(self.fps_counter)
-        self.objects.append(ScoreCounter(game=self))
+        self.add_object(self.fps_counter)
+        self.add_object(ScoreCounter(game=self))
 
         self.current_mole = Mole(game=self)
-        self.objects.append(self.current_mole)
+        self._mole_index = self.add_object(self.current_mole)
 
         while not self.exited:
             self.execute_tick()
             self.draw_frame()
             self.update_display()
 
-            self.recent_frame_times.append(self.clock.get_rawtime())
+            self.record_frame_time(self.clock.get_rawtime())
             self.clock.tick(self.max_fps)
 
         self.objects.clear()
+        self._draw_callbacks.clear()
+        self._tick_callbacks.clear()
         self.key_action_callbacks.clear()
-        self.key_up_callbacks.clear()
+        self.key_up_callbacks = [None] * len(self.key_up_callbacks)
+        self.extended_key_up_callbacks.clear()
 
 
 class Texture:
+    __slots__ = ("base_width", "base_height")
+
     def __init__(self, width, height):
         self.base_width = width
         self.base_height = height
@@ -434,11 +747,14 @@ class Texture:
     def width(self) -> float:
         return self.base_width
 
-    def draw_at(self, top_left: PointSpecifier):
+    def draw_at(self, top_left: PointSpecifier) -> Optional[pygame.Rect]:
+        """Draws the texture, returning the screen rect that was actually drawn to"""
         pass
 
 
 class PlainColorTexture(Texture):
+    __slots__ = ("game", "color")
+
     def __init__(self, game: Game, color: Color, width, height):
         self.game = game
         self.color = color
@@ -447,7 +763,7 @@ class PlainColorTexture(Texture):
     def draw_at(self, position: PointSpecifier):
         x1, y1 = position.calculate_top_left(self.game, self.width(), self.height())
 
-        pygame.draw.rect(
+        return pygame.draw.rect(
             self.game.surface,
             self.color,
             [x1, y1, self.width(), self.height()],
@@ -455,6 +771,17 @@ class PlainColorTexture(Texture):
 
 
 class TextTexture(Texture):
+    __slots__ = (
+        "game",
+        "_get_content",
+        "font",
+        "get_color",
+        "_cache_key",
+        "_cache_surface",
+        "_cache_rect",
+        "current_rect",
+    )
+
     def width(self) -> float:
         return self.current_rect.width
 
@@ -468,12 +795,26 @@ class TextTexture(Texture):
         return provided_content
 
     def render_text(self, start_x: float, start_y: float):
-        """Computes a surface and bounding rect for the text, but doesn't draw it to the screen"""
+        """Computes a surface and bounding rect for the text, but doesn't draw it to the screen
+
+        - Re-uses the previously-rendered surface if the text and color haven't changed, \
+        since font rasterization is expensive and the content rarely changes every frame
+        """
         text_content, text_color = self.get_content()
-        use_antialiasing = True
-        text_surface = self.font.render(text_content, use_antialiasing, text_color)
+        cache_key = (text_content, tuple(text_color))
 
-        text_rect = text_surface.get_rect()
+        if cache_key == self._cache_key:
+            text_surface = self._cache_surface
+        else:
+            use_antialiasing = True
+            text_surface = self.font.render(text_content, use_antialiasing, text_color)
+            self._cache_key = cache_key
+            self._cache_surface = text_surface
+            self._cache_rect = text_surface.get_rect()
+
+        # Text surfaces are position-independent, so repositioning the cached
+        # rect is all that's needed to "render" at a new location
+        text_rect = self._cache_rect
         text_rect.left = math.floor(start_x)
         text_rect.top = math.floor(start_y)
 
@@ -490,7 +831,12 @@ class TextTexture(Texture):
         self._get_content = get_content
         self.font = font
         self.get_color = get_color or (lambda: self.game.theme.FOREGROUND)
-        self.current_rect = self.render_text(0, 0)[1]
+        self._cache_key = None
+        self._cache_surface = None
+        self._cache_rect = None
+        # This initial render also seeds the surface cache, so the first
+        # draw_at won't have to rasterize again
+        _, self.current_rect = self.render_text(0, 0)
         super().__init__(self.width(), self.height())
 
     def draw_at(self, position: PointSpecifier):
@@ -499,10 +845,31 @@ class TextTexture(Texture):
         )
         text_surface, text_rect = self.render_text(start_x, start_y)
         self.current_rect = text_rect
-        self.game.surface.blit(text_surface, text_rect)
+        return self.game.surface.blit(text_surface, text_rect)
+
+
+_image_cache: dict[str, pygame.Surface] = {}
+
+
+def load_image(path: Path) -> pygame.Surface:
+    """Loads an image, converted to the display's pixel format and cached
+
+    - Repeated loads of the same file (e.g. each mole respawn) share a single \
+    surface instead of re-reading and re-decoding it from disk
+    - convert_alpha() means blits don't have to convert pixel formats on the \
+    fly, so it must be called after the display has been initialised
+    """
+    cache_key = str(path)
+    cached = _image_cache.get(cache_key)
+    if cached is None:
+        cached = pygame.image.load(path).convert_alpha()
+        _image_cache[cache_key] = cached
+    return cached
 
 
 class ImageTexture(Texture):
+    __slots__ = ("game", "image")
+
     def __init__(self, game, image):
         self.game = game
         self.image = image
@@ -515,10 +882,22 @@ class ImageTexture(Texture):
         start_x, start_y = position.calculate_top_left(
             self.game, self.width(), self.height()
         )
-        self.game.surface.blit(self.image, (start_x, start_y))
+        return self.game.surface.blit(self.image, (start_x, start_y))
 
 
 class GameObject:
+    # Subclasses still get a __dict__ of their own (none declare __slots__),
+    # so these just give the common hot attributes fixed slot storage
+    __slots__ = (
+        "game",
+        "tick_tasks",
+        "on_click_tasks",
+        "texture",
+        "is_solid",
+        "spawned_at",
+        "position",
+    )
+
     def height(self) -> float:
         return self.texture.height()
 
@@ -545,10 +924,11 @@ class GameObject:
         self.on_click_tasks: list[Callable[[Event], None]] = []
         self.texture = texture
         self.is_solid = solid
-        self.spawned_at = pygame.time.get_ticks()
+        self.spawned_at = self.game.current_tick_ms
         self.reset()
 
-    def draw(self):
+    def draw(self) -> Optional[pygame.Rect]:
+        """Draws the object, returning the screen rect that was actually drawn to"""
         raise NotImplementedError()
 
     def run_tick_tasks(self):
@@ -556,9 +936,13 @@ class GameObject:
             callback()
 
     def age(self) -> float:
-        """Returns milliseconds since this game object was initialised"""
-        current_time = pygame.time.get_ticks()
-        return current_time - self.spawned_at
+        """Returns milliseconds since this game object was initialised
+
+        - Measured against the game's per-tick clock snapshot, so all \
+        objects age at the same logical instant without each paying for a \
+        pygame clock call
+        """
+        return self.game.current_tick_ms - self.spawned_at
     
     def calculate_center_bounds(self, parent_width: float, parent_height: float) -> Box:
         """Calculates the box of possible positions for the center point of this object"""
@@ -574,13 +958,11 @@ class GameObject:
 
     def collision_box(self) -> Box:
         """Calculates the visual bounding box (i.e. collision box) for this object"""
-        x1, y1 = self.position.calculate_top_left(
-            self.game, self.width(), self.height()
-        )
-        x2 = x1 + self.width()
-        y2 = y1 + self.height()
+        width = self.width()
+        height = self.height()
+        x1, y1 = self.position.calculate_top_left(self.game, width, height)
 
-        return Box(x1, y1, x2, y2)
+        return Box(x1, y1, x1 + width, y1 + height)
 
     def calculate_position_percentage(self, bounds: Box) -> Tuple[float, float]:
         """Calculates the position of the center of the object, returning coordinates in the form (x, y)
@@ -623,17 +1005,28 @@ class GameObject:
     def closest_window_edge(self) -> Edge:
         outer_box = self.game.window_box()
         our_x, our_y = self.coordinates()
-        distances = {
-            Edge.TOP: abs(outer_box.top - our_y),
-            Edge.BOTTOM: abs(outer_box.bottom - our_y),
-            Edge.LEFT: abs(outer_box.left - our_x),
-            Edge.RIGHT: abs(outer_box.right - our_x),
-        }
-        closest_edge = min(distances, key=distances.get)
+
+        # Unrolled min-of-four; abs() stays because the mole sits outside the
+        # window during its birth and death animations
+        closest_distance = abs(outer_box.top - our_y)
+        closest_edge = Edge.TOP
+        distance = abs(outer_box.bottom - our_y)
+        if distance < closest_distance:
+            closest_distance = distance
+            closest_edge = Edge.BOTTOM
+        distance = abs(outer_box.left - our_x)
+        if distance < closest_distance:
+            closest_distance = distance
+            closest_edge = Edge.LEFT
+        distance = abs(outer_box.right - our_x)
+        if distance < closest_distance:
+            closest_edge = Edge.RIGHT
         return closest_edge
         
 
 class Velocity:
+    __slots__ = ("x", "y", "base_speed", "object")
+
     def on_tick(self):
         x_movement = self.x
         y_movement = self.y
@@ -660,23 +1053,36 @@ class Velocity:
     
 class FPSCounter(GameObject):
     def draw(self):
-        self.texture.draw_at(self.position)
+        return self.texture.draw_at(self.position)
 
     def calculate_color(self, fps: float) -> pygame.Color:
+        # Comparing against max_fps directly behaves identically to flooring
+        # first (the threshold is an integer), so skip the math.floor call
         color = self.game.theme
-        if fps < game.max_fps / 2:
+        if fps < self._half_max_fps:
             return color.RED
-        if math.floor(fps) < game.max_fps:
+        if fps < self._max_fps:
             return color.YELLOW
         return color.FOREGROUND
 
     def get_content(self) -> Tuple[str, Color]:
-        fps = self.game.clock.get_fps()
-        color = self.calculate_color(fps)
-        return f"{fps:.0f} FPS", color
+        # The visible number doesn't need 60Hz updates, so only query the
+        # clock and rebuild the string every 6th tick (~10Hz) and serve the
+        # cached content in between
+        tick = self.game._tick_id
+        if self._cached_content is None or tick - self._cached_at_tick >= 6:
+            fps = self.game.clock.get_fps()
+            color = self.calculate_color(fps)
+            self._cached_content = (f"{fps:.0f} FPS", color)
+            self._cached_at_tick = tick
+        return self._cached_content
 
     def __init__(self, game: Game):
         self.game = game
+        self._cached_content: Optional[Tuple[str, Color]] = None
+        self._cached_at_tick = 0
+        self._max_fps = game.max_fps
+        self._half_max_fps = game.max_fps / 2
         self.font = pygame.font.Font("freesansbold.ttf", 12)
         self.spawn_point = lambda: PixelsPoint(
             x=0, y=0, outer_corner=Corner.TOP_RIGHT, self_corner=Corner.TOP_RIGHT
@@ -695,7 +1101,7 @@ class FPSCounter(GameObject):
 
 class ScoreCounter(GameObject):
     def draw(self):
-        self.texture.draw_at(self.position)
+        return self.texture.draw_at(self.position)
 
     def get_content(self) -> str:
         return f"Score: {self.game.score}"
@@ -712,13 +1118,13 @@ class ScoreCounter(GameObject):
 
 class Mole(GameObject):
     def draw(self):
-        self.texture.draw_at(self.position)
+        return self.texture.draw_at(self.position)
 
-    def generate_spawn_position(self, outer_size: float, margin: float) -> int:
-        lower_bound = math.ceil(margin)
-        upper_bound = math.floor(outer_size - margin)
-        # print(f"Margin {margin}, range {lower_bound}..{upper_bound}")
-        return random.randint(lower_bound, upper_bound)
+    def generate_spawn_position(self, outer_size: float, margin: float) -> float:
+        # Positions are floats throughout, so there's no need to round the
+        # bounds to ints just for randint's sake (which also rejection-samples
+        # internally); one uniform draw does the job
+        return random.uniform(margin, outer_size - margin)
 
     def spawn_point(self) -> PointSpecifier:
         #print("Mole dimensions", self.width(), self.height())
@@ -763,21 +1169,18 @@ class Mole(GameObject):
             self.position.y = self.game.height() + self.height()
 
     def do_birth_animation(self):
-        # nearest_corner_x, nearest_corner_y = self.closest_window_edge().value
-        # if nearest_corner_x != 0:
-        #     if self.position.x == -1:
         self.is_birth_animation = True
         self.set_pre_birth_positon()
         # Move onto the screen (towards the target edge) until it reaches its spawn point
         target_edge_x, target_edge_y = self.closest_window_edge().value
         self.velocity.shove_x(-target_edge_x)
         self.velocity.shove_y(-target_edge_y)
-        print(self.position.x, self.position.y, "+ velocity", self.velocity.x, self.velocity.y)
-    
+
+
     def __init__(self, game: Game) -> None:
         self.game = game
         # Mole image adapted from the Mullvad VPN logo: https://mullvad.net/en/press
-        texture_image = pygame.image.load(Path("assets", "mole.svg"))
+        texture_image = load_image(Path("assets", "mole.svg"))
         texture = ImageTexture(game=game, image=texture_image)
         super().__init__(texture=texture)
         self.on_click_tasks.append(self.handle_whack)